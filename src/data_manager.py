@@ -6,13 +6,20 @@ Consolidated data loading, processing, and validation for all survey analysis.
 
 import pandas as pd
 import json
+import os
+import tempfile
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: Parquet column checks read the whole file
+    pq = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,6 +88,7 @@ class DataManager:
     # Data paths
     RAW_DATA_PATH = "data/mobility-data.csv"
     PROCESSED_DATA_PATH = "data/processed_mobility_data.csv"
+    PROCESSED_PARQUET_PATH = "data/processed_mobility_data.parquet"
     MOBILITY_JSON_PATH = "outputs/bgu_mobility_data.json"
     OUTPUTS_DIR = "outputs"
 
@@ -96,6 +104,8 @@ class DataManager:
         "רכיבה על סוסים": "horseback",
         "אחר": "other",
     }
+    # Lookup table for Series.map, built once instead of from the dict per call
+    TRANSPORT_MODE_SERIES = pd.Series(TRANSPORT_MODE_MAPPING)
 
     # Route choice factors
     ROUTE_CHOICE_FACTORS = {
@@ -116,6 +126,82 @@ class DataManager:
         """Ensure outputs directory exists"""
         Path(self.OUTPUTS_DIR).mkdir(exist_ok=True)
 
+    @staticmethod
+    def read_csv(path: str, **kwargs) -> pd.DataFrame:
+        """Read a CSV with pyarrow's multithreaded parser, falling back to the C engine."""
+        try:
+            return pd.read_csv(path, engine="pyarrow", **kwargs)
+        except ImportError:
+            return pd.read_csv(path, engine="c", **kwargs)
+
+    @staticmethod
+    def present_columns(
+        columns: Optional[List[str]], available: Iterable[str]
+    ) -> Optional[List[str]]:
+        """Keep the requested columns that exist, so callers' own checks run."""
+        if columns is None:
+            return None
+        available = set(available)
+        return [col for col in columns if col in available]
+
+    @staticmethod
+    def _write_parquet_atomic(df: pd.DataFrame, parquet_path: str) -> None:
+        """Write a Parquet cache via a temp file, so readers never see a partial one."""
+        parquet_dir = os.path.dirname(parquet_path) or "."
+        fd, tmp_path = tempfile.mkstemp(
+            dir=parquet_dir, prefix=".", suffix=".parquet.tmp"
+        )
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path, compression="zstd", index=False)
+            os.replace(tmp_path, parquet_path)
+        except (ImportError, ValueError, TypeError, OSError) as e:
+            logger.warning(f"Could not cache data as Parquet at {parquet_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def read_csv_cached(
+        csv_path: str,
+        columns: Optional[List[str]] = None,
+        parquet_path: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Read a CSV through a Parquet sidecar, rebuilding it when stale.
+
+        The sidecar defaults to the CSV path with a ``.parquet`` suffix and is
+        shared by every script that reads the same CSV; this is the only
+        writer, so its dtypes always come from the same CSV engine. Requested
+        columns missing from the data are left out of the result rather than
+        raising.
+        """
+        if parquet_path is None:
+            parquet_path = str(Path(csv_path).with_suffix(".parquet"))
+        csv_mtime = os.path.getmtime(csv_path)
+
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= csv_mtime:
+            try:
+                if pq is not None:
+                    available = pq.read_schema(parquet_path).names
+                    present = DataManager.present_columns(columns, available)
+                    return pd.read_parquet(parquet_path, columns=present)
+                df = pd.read_parquet(parquet_path)
+                present = DataManager.present_columns(columns, df.columns)
+                return df if present is None else df[present]
+            except ImportError:
+                pass
+            except (OSError, ValueError) as e:
+                # A corrupt sidecar (pyarrow's ArrowInvalid is a ValueError)
+                # is a cache miss: re-read the CSV and rewrite it below
+                logger.warning(f"Ignoring unreadable Parquet cache {parquet_path}: {e}")
+
+        df = DataManager.read_csv(csv_path)
+        DataManager._write_parquet_atomic(df, parquet_path)
+
+        present = DataManager.present_columns(columns, df.columns)
+        return df if present is None else df[present]
+
     def load_raw_data(self) -> pd.DataFrame:
         """Load raw survey data with validation."""
         cache_key = "raw_data"
@@ -144,6 +230,12 @@ class DataManager:
             logger.error(f"Error loading raw data: {e}")
             return pd.DataFrame()
 
+    def _read_processed_data(self) -> pd.DataFrame:
+        """Read processed data from its Parquet sidecar, rebuilding it when stale."""
+        return self.read_csv_cached(
+            self.PROCESSED_DATA_PATH, parquet_path=self.PROCESSED_PARQUET_PATH
+        )
+
     def load_processed_data(self) -> pd.DataFrame:
         """Load processed survey data with fallback to raw data."""
         cache_key = "processed_data"
@@ -152,7 +244,7 @@ class DataManager:
             return self._cache[cache_key]
 
         try:
-            df = pd.read_csv(self.PROCESSED_DATA_PATH)
+            df = self._read_processed_data()
             logger.info(f"✓ Loaded processed data: {df.shape[0]} rows")
             self._cache[cache_key] = df
             return df
@@ -248,13 +340,16 @@ class DataManager:
         if df.empty or "Transportation-Mode" not in df.columns:
             return {}
 
-        # Count modes using English mapping
-        mode_counts = {}
-        for mode in df["Transportation-Mode"].dropna():
-            english_mode = self.TRANSPORT_MODE_MAPPING.get(mode, "unknown")
-            mode_counts[english_mode] = mode_counts.get(english_mode, 0) + 1
-
-        return mode_counts
+        # Count modes using English mapping; unmapped answers count as unknown
+        english_modes = (
+            df["Transportation-Mode"]
+            .dropna()
+            .map(self.TRANSPORT_MODE_SERIES)
+            .fillna("unknown")
+        )
+        return {
+            mode: int(count) for mode, count in english_modes.value_counts().items()
+        }
 
     def get_participation_data(self) -> Dict[str, Any]:
         """Get participation interest data from completed surveys only."""
@@ -306,23 +401,28 @@ class DataManager:
         if df.empty:
             return {}
 
+        factor_cols = [col for col in self.ROUTE_CHOICE_FACTORS if col in df.columns]
+        if not factor_cols:
+            # agg() on a frame without columns raises instead of returning empty
+            return {}
+
+        # Convert and reduce every factor column at once; NaN marks no response
+        route_data = df[factor_cols].apply(pd.to_numeric, errors="coerce")
+        stats = route_data.agg(["count", "mean", "std"])
+
         factor_stats = {}
 
-        for factor_col, factor_name in self.ROUTE_CHOICE_FACTORS.items():
-            if factor_col in df.columns:
-                valid_responses = pd.to_numeric(
-                    df[factor_col], errors="coerce"
-                ).dropna()
-
-                if len(valid_responses) > 0:
-                    factor_stats[factor_name] = {
-                        "count": len(valid_responses),
-                        "mean": float(valid_responses.mean()),
-                        "std": float(valid_responses.std()),
-                        "value_counts": valid_responses.value_counts()
-                        .sort_index()
-                        .to_dict(),
-                    }
+        for factor_col in factor_cols:
+            if stats.at["count", factor_col] > 0:
+                factor_stats[self.ROUTE_CHOICE_FACTORS[factor_col]] = {
+                    "count": int(stats.at["count", factor_col]),
+                    "mean": float(stats.at["mean", factor_col]),
+                    "std": float(stats.at["std", factor_col]),
+                    "value_counts": route_data[factor_col]
+                    .value_counts()
+                    .sort_index()
+                    .to_dict(),
+                }
 
         return factor_stats
 
@@ -26,11 +26,15 @@ from dataclasses import dataclass
 import polyline
 from math import radians, cos, sin, asin, sqrt
 import os
+import re
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Markers checked in the generated HTML; matched in a single regex pass
+HTML_MARKER_PATTERN = re.compile(r"@deck\.gl/carto|deck\.gl|tripsData")
+
 @dataclass
 class Coordinate:
     """Coordinate data class with validation"""
@@ -1822,12 +1826,19 @@ def main():
     logger.info(f"   - JSON output exists: {os.path.exists(json_output)}")
     logger.info(f"   - HTML output exists: {os.path.exists(html_output)}")
     if os.path.exists(html_output):
-        with open(html_output, 'r') as f:
+        with open(html_output, 'r', encoding='utf-8') as f:
             content = f.read()
-            logger.info(f"   - HTML file size: {len(content)} characters")
-            logger.info(f"   - Contains 'deck.gl': {'deck.gl' in content}")
-            logger.info(f"   - Contains '@deck.gl/carto': {'@deck.gl/carto' in content}")
-            logger.info(f"   - Contains trip data: {'tripsData' in content}")
+        markers = set()
+        for match in HTML_MARKER_PATTERN.finditer(content):
+            markers.add(match.group(0))
+            if len(markers) == 3:
+                break
+        # '@deck.gl/carto' consumes its inner 'deck.gl' match
+        has_deck = 'deck.gl' in markers or '@deck.gl/carto' in markers
+        logger.info(f"   - HTML file size: {len(content)} characters")
+        logger.info(f"   - Contains 'deck.gl': {has_deck}")
+        logger.info(f"   - Contains '@deck.gl/carto': {'@deck.gl/carto' in markers}")
+        logger.info(f"   - Contains trip data: {'tripsData' in markers}")
     
     logger.info("🚀 Open the HTML file in your browser to view the visualization!")
     logger.info("📊 Debug logs are available in the browser console (F12 → Console tab).")
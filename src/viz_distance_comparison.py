@@ -6,14 +6,15 @@ Creates a line chart comparing perceived distance importance vs actual route dis
 
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 import numpy as np
 import os
-import json
 from typing import List, Dict, Tuple
 
 from viz_utils import data_loader, styling, exporter
 
+# Page background for the shared iframe template
+PAGE_BACKGROUND = "linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%)"
+
 
 def get_route_distances() -> Dict:
     """Load actual route distances from OTP analysis."""
@@ -21,19 +22,34 @@ def get_route_distances() -> Dict:
 
     if data and "routes" in data:
         routes = data["routes"]
-        distances = [route["distance"] for route in routes if "distance" in route]
+        # Collect every route's distance straight into a contiguous float64
+        # array, so the stats cover repeated ids as well
+        distances = np.fromiter(
+            (route["distance"] for route in routes if "distance" in route),
+            dtype=np.float64,
+        )
+        # Route distances by submission ID for linking; routes without an id
+        # cannot be linked and are skipped
+        route_lookup = {
+            route["id"]: route.get("distance", 0)
+            for route in routes
+            if route.get("id") is not None
+        }
+        has_data = distances.size > 0
 
-        print(f"✓ Loaded {len(distances)} route distances from OTP data")
+        print(f"✓ Loaded {distances.size} route distances from OTP data")
         return {
             "distances": distances,
-            "avg_distance": np.mean(distances) if distances else 0,
-            "median_distance": np.median(distances) if distances else 0,
-            "std_distance": np.std(distances) if distances else 0,
+            "route_lookup": route_lookup,
+            "avg_distance": distances.mean() if has_data else 0,
+            "median_distance": np.median(distances) if has_data else 0,
+            "std_distance": distances.std() if has_data else 0,
         }
     else:
         print("⚠️  Route distance data not found")
         return {
-            "distances": [],
+            "distances": np.empty(0),
+            "route_lookup": {},
             "avg_distance": 0,
             "median_distance": 0,
             "std_distance": 0,
@@ -60,12 +76,11 @@ def analyze_perceived_distance_importance(df: pd.DataFrame) -> Dict:
     # This makes higher values = more important for better visualization
     inverted_responses = 6 - distance_responses
 
-    # Calculate distribution
-    importance_dist = {}
-    for i in range(1, 6):
-        original_value = 6 - i  # Convert back to original scale for counting
-        count = sum(distance_responses == original_value)
-        importance_dist[i] = count
+    # Calculate distribution with one counting pass over the inverted scale
+    importance_counts = inverted_responses.value_counts().reindex(
+        range(1, 6), fill_value=0
+    )
+    importance_dist = {i: int(importance_counts[i]) for i in range(1, 6)}
 
     avg_importance = inverted_responses.mean()
 
@@ -208,18 +223,9 @@ def link_perceived_and_actual_distances(
     """Link survey responses to actual route distances using submission IDs."""
     linked_data = []
 
-    # Create a lookup dictionary for route distances by submission ID
-    route_lookup = {}
-    try:
-        with open("outputs/bgu_mobility_data.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        for route in data["routes"]:
-            submission_id = route["id"]
-            distance = route.get("distance", 0)
-            route_lookup[submission_id] = distance
-
-    except FileNotFoundError:
+    # Route distances by submission ID, projected by get_route_distances
+    route_lookup = actual_data["route_lookup"]
+    if not route_lookup:
         print("⚠️  Route data not found for linking")
         return linked_data
 
@@ -230,10 +236,20 @@ def link_perceived_and_actual_distances(
         print(f"⚠️  Column {distance_col} not found")
         return linked_data
 
-    # Process each survey response
-    for idx, row in df.iterrows():
-        submission_id = row.get("Submission ID")
-        distance_importance_raw = row.get(distance_col)
+    if "Submission ID" not in df.columns:
+        print("⚠️  Column Submission ID not found")
+        return linked_data
+
+    # Process each survey response. The two columns are zipped rather than
+    # iterated as rows, which would upcast every ID to float64
+    for submission_id, distance_importance_raw in zip(
+        df["Submission ID"].to_numpy(dtype=object),
+        df[distance_col].to_numpy(dtype=object),
+    ):
+        # IDs read back as floats (e.g. when some are missing) label and look
+        # up the same as the integer IDs in the route data
+        if isinstance(submission_id, float) and submission_id.is_integer():
+            submission_id = int(submission_id)
 
         # Check if we have both pieces of data
         if (
@@ -258,92 +274,24 @@ def link_perceived_and_actual_distances(
     return linked_data
 
 
-def create_iframe_optimized_html(fig: go.Figure, filename: str, title: str) -> None:
-    """Create HTML file specifically optimized for iframe embedding."""
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <script src="https://cdn.plot.ly/plotly-2.26.0.min.js"></script>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%);
-            font-family: 'Inter', system-ui, sans-serif;
-            overflow: hidden;
-        }}
-        
-        #plotly-div {{
-            width: 100%;
-            height: 100vh;
-            margin: 0;
-            padding: 0;
-        }}
-        
-        .modebar {{
-            opacity: 0.3;
-            transition: opacity 0.3s ease;
-        }}
-        
-        .modebar:hover {{
-            opacity: 1;
-        }}
-    </style>
-</head>
-<body>
-    <div id="plotly-div"></div>
-    
-    <script>
-        var figureJSON = {fig.to_json()};
-        
-        var config = {{
-            displayModeBar: true,
-            displaylogo: false,
-            modeBarButtonsToRemove: ['pan2d', 'lasso2d', 'select2d'],
-            responsive: true,
-            toImageButtonOptions: {{
-                format: 'png',
-                filename: '{title.lower().replace(" ", "_")}',
-                height: 800,
-                width: 1200,
-                scale: 2
-            }}
-        }};
-        
-        Plotly.newPlot('plotly-div', figureJSON.data, figureJSON.layout, config);
-        
-        window.addEventListener('resize', function() {{
-            Plotly.Plots.resize('plotly-div');
-        }});
-        
-        setTimeout(function() {{
-            Plotly.Plots.resize('plotly-div');
-        }}, 100);
-    </script>
-</body>
-</html>"""
-
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-
 def export_figure(fig: go.Figure, filename_base: str, title: str) -> None:
-    """Export figure as both optimized HTML and PNG."""
+    """Export figure via the shared iframe template (PNG with BGU_EXPORT_PNG=1)."""
     html_path = f"outputs/{filename_base}.html"
     png_path = f"outputs/{filename_base}.png"
 
-    create_iframe_optimized_html(fig, html_path, title)
+    # Convert the figure once; the HTML and PNG writers share this dict
+    fig_dict = fig.to_plotly_json()
+
+    exporter.ensure_outputs_dir()
+    exporter.create_iframe_optimized_html(
+        fig_dict, html_path, title, background_gradient=PAGE_BACKGROUND
+    )
     print(f"✓ Saved iframe-optimized HTML: {html_path}")
 
-    try:
-        fig.write_image(png_path, width=1200, height=800, scale=2, engine="kaleido")
-        print(f"✓ Saved PNG: {png_path}")
-    except Exception as e:
-        print(f"⚠️  PNG export failed: {e}")
+    if exporter.EXPORT_PNG:
+        exporter.queue_png_export(
+            fig_dict, png_path, filename_base, width=1200, height=800
+        )
 
 
 def main():
@@ -351,8 +299,10 @@ def main():
     print("📏 Creating Distance Comparison Analysis")
     print("=" * 45)
 
-    # Load data
-    df = data_loader.load_processed_data()
+    # Load only the columns used for linking responses to routes
+    df = data_loader.load_processed_data(
+        columns=["Submission ID", "Routechoice-Distance"]
+    )
 
     # Analyze perceived distance importance
     perceived_data = analyze_perceived_distance_importance(df)
@@ -360,7 +310,7 @@ def main():
     # Get actual route distances
     actual_data = get_route_distances()
 
-    if not perceived_data["responses"] and not actual_data["distances"]:
+    if not perceived_data["responses"] and actual_data["distances"].size == 0:
         print("⚠️  No distance data available for comparison!")
         return None
 
@@ -381,8 +331,8 @@ def main():
             f"   • Average importance rating: {perceived_data['avg_importance']:.2f}/5"
         )
 
-    if actual_data["distances"]:
-        print(f"   • Actual route distances analyzed: {len(actual_data['distances'])}")
+    if actual_data["distances"].size:
+        print(f"   • Actual route distances analyzed: {actual_data['distances'].size}")
         print(f"   • Average actual distance: {actual_data['avg_distance']:.2f} km")
         print(f"   • Median actual distance: {actual_data['median_distance']:.2f} km")
 
@@ -6,7 +6,6 @@ using the same color scheme as the main application.
 """
 
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 import os
@@ -91,7 +91,6 @@ def main():
     print("\n🎯 Participation analysis completed!")
     print("📊 Analysis focused on completed surveys only")
     print("📱 HTML file is now responsive and will fill the browser window")
-    print("🖼️  PNG file exported at 1920x1080 resolution")
 
     return comparison_fig
 
@@ -23,6 +23,9 @@ from math import radians, cos, sin, asin, sqrt
 from viz_utils import data_loader, processor, map_utils
 from data_manager import Coordinate, BGUGateData
 
+# Hebrew to English display names, built once instead of per lookup
+MODE_DISPLAY_NAMES = processor.get_transport_mode_display_mapping()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -62,6 +65,17 @@ class CoordinateParser:
 class OTPRouteSimulator:
     """Simulate routes using OpenTripPlanner server"""
 
+    # Hebrew transportation modes to OTP modes, built once per process
+    OTP_MODE_MAPPING = {
+        "ברגל": "WALK",
+        "אופניים": "BICYCLE",
+        "אופניים/קורקינט חשמלי": "BICYCLE",
+        "רכב": "CAR",
+        "אוטובוס": "TRANSIT,WALK",
+        "רכבת": "TRANSIT,WALK",
+        "": "WALK",  # Default to walking
+    }
+
     def __init__(
         self,
         base_url: str = "http://localhost:8080/otp/routers/default",
@@ -136,16 +150,7 @@ class OTPRouteSimulator:
 
     def _map_transportation_mode(self, hebrew_mode: str) -> str:
         """Map Hebrew transportation modes to OTP modes"""
-        mode_mapping = {
-            "ברגל": "WALK",
-            "אופניים": "BICYCLE",
-            "אופניים/קורקינט חשמלי": "BICYCLE",
-            "רכב": "CAR",
-            "אוטובוס": "TRANSIT,WALK",
-            "רכבת": "TRANSIT,WALK",
-            "": "WALK",  # Default to walking
-        }
-        return mode_mapping.get(hebrew_mode, "WALK")
+        return self.OTP_MODE_MAPPING.get(hebrew_mode, "WALK")
 
     def _query_otp_route_with_mode(
         self, origin: Coordinate, destination: Coordinate, transportation_mode: str
@@ -255,7 +260,7 @@ def translate_mode_to_english(mode: str) -> str:
     """Translate Hebrew transportation modes to English"""
     if pd.isna(mode) or str(mode).lower() == "nan":
         return "No Mode Data"
-    return processor.get_transport_mode_display_mapping().get(mode, mode)
+    return MODE_DISPLAY_NAMES.get(mode, mode)
 
 
 def parse_coordinates(coord_string: str) -> list:
@@ -851,6 +856,23 @@ def export_folium_map(
     )
 
 
+def save_poi_data(poi_df: pd.DataFrame, use_csv: bool = False) -> str:
+    """Save processed POIs as zstd Parquet, or as CSV when requested or pyarrow is missing."""
+    if not use_csv:
+        parquet_path = "outputs/processed_poi_data.parquet"
+        try:
+            poi_df.to_parquet(
+                parquet_path, engine="pyarrow", compression="zstd", index=False
+            )
+            return parquet_path
+        except ImportError:
+            print("⚠️  pyarrow not installed, saving POI data as CSV")
+
+    csv_path = "outputs/processed_poi_data.csv"
+    poi_df.to_csv(csv_path, index=False)
+    return csv_path
+
+
 def main():
     """Main function to create enhanced POI visualization with OTP route lines."""
     print("🗺️  Creating BGU Student POI Map with Mode Filtering")
@@ -877,7 +899,8 @@ def main():
 
     # Save processed data
     if len(poi_df) > 0:
-        poi_df.to_csv("outputs/processed_poi_data.csv", index=False)
+        poi_path = save_poi_data(poi_df)
+        print(f"✓ Saved processed POI data: {poi_path}")
 
     if routes:
         route_summary = [
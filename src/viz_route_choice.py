@@ -5,100 +5,154 @@ Creates interactive spider/radar charts optimized for iframe embedding.
 """
 
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 import os
+import warnings
+from dataclasses import dataclass
+from typing import Tuple
 
 from viz_utils import data_loader, styling, exporter, processor
 
+# Route choice factor columns and their English labels, in chart order
+ROUTE_CHOICE_FACTORS = processor.get_route_choice_factors()
+FACTOR_LABELS = tuple(ROUTE_CHOICE_FACTORS.values())
 
-def prepare_route_choice_data(df: pd.DataFrame) -> pd.DataFrame:
-    """Prepare and validate route choice factor data."""
+# Angular positions of the closed radar polygon, shared by every spider trace
+THETA_CLOSED = FACTOR_LABELS + (FACTOR_LABELS[0],)
 
-    # Route choice factors with English labels
-    factors = processor.get_route_choice_factors()
+# Green gradient for the ranked comparison bars - lighter greens for higher importance
+COMPARISON_COLORS = np.array(
+    [
+        "#6ee7b7",  # Very light green (most important)
+        "#34d399",  # Light green
+        "#10b981",  # Medium-light green
+        "#059669",  # Medium green
+        "#047857",  # Medium-dark green
+        "#065f46",  # Dark green
+        "#064e3b",  # Very dark green (least important)
+    ]
+)
+
+
+@dataclass(frozen=True)
+class FactorStats:
+    """Route choice statistics as parallel arrays, one entry per factor."""
+
+    names: np.ndarray
+    importance: np.ndarray
+    original_means: np.ndarray
+    counts: np.ndarray
+    stds: np.ndarray
+
+    def ranked(self) -> "FactorStats":
+        """Return the factors sorted by importance (descending; ties keep order)."""
+        order = np.argsort(-self.importance, kind="stable")
+        return FactorStats(
+            names=self.names[order],
+            importance=self.importance[order],
+            original_means=self.original_means[order],
+            counts=self.counts[order],
+            stds=self.stds[order],
+        )
 
-    # Extract route choice data
-    route_data = df[list(factors.keys())].copy()
 
-    # Convert to numeric and handle missing values
-    for col in factors.keys():
-        route_data[col] = pd.to_numeric(route_data[col], errors="coerce")
+def aggregate_likert(
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Aggregate a (responses x factors) Likert matrix column-wise.
 
-    # Calculate statistics for each factor
-    factor_stats = {}
+    NaN marks a missing response. Returns (importance, means, stds, counts);
+    factors without responses are reported as zeros. Works on any subset of
+    rows, so subgroup or bootstrap analyses can reuse it directly.
+    """
+    counts = np.isfinite(values).sum(axis=0)
+    has_data = counts > 0
 
-    print(f"🛣️  Route Choice Factor Analysis:")
-    print(f"Note: Scale is 1-5 where 1=Most Important, 5=Least Important")
+    with warnings.catch_warnings():
+        # Empty and single-response factors produce NaN (std uses ddof=1 to
+        # match pandas)
+        warnings.simplefilter("ignore", RuntimeWarning)
+        means = np.nanmean(values, axis=0)
+        stds = np.nanstd(values, axis=0, ddof=1)
+
+    means = np.where(has_data, means, 0.0)
+    stds = np.where(has_data, stds, 0.0)
 
-    for original_col, english_name in factors.items():
-        valid_data = route_data[original_col].dropna()
+    # Invert scale for better visualization (higher = more important)
+    # Original: 1=most important, 5=least important
+    # Inverted: 5=most important, 1=least important
+    importance = np.where(has_data, 6 - means, 0.0)
 
-        if len(valid_data) > 0:
-            # Invert scale for better visualization (higher = more important)
-            # Original: 1=most important, 5=least important
-            # Inverted: 5=most important, 1=least important
-            inverted_mean = 6 - valid_data.mean()
+    return importance, means, stds, counts
+
+
+def close(a: np.ndarray) -> np.ndarray:
+    """Close a radar polygon by repeating the first value at the end."""
+    return np.concatenate([a, a[:1]])
+
+
+def prepare_route_choice_data(
+    df: pd.DataFrame,
+) -> Tuple[FactorStats, FactorStats, pd.DataFrame]:
+    """Prepare and validate route choice factor data.
+
+    Returns the factor statistics in survey order (for the spider chart), the
+    same statistics ranked by importance, and the numeric route choice data.
+    """
+
+    # Extract route choice data, converting every factor to numeric in one pass;
+    # 1-5 rankings fit in nullable Int8, which masks missing responses natively
+    route_data = df[list(ROUTE_CHOICE_FACTORS)].apply(
+        lambda col: pd.to_numeric(col, errors="coerce").astype("Int8")
+    )
+
+    importance, original_means, stds, counts = aggregate_likert(
+        route_data.to_numpy(dtype=np.float64, na_value=np.nan)
+    )
+
+    factor_stats = FactorStats(
+        names=np.array(FACTOR_LABELS),
+        importance=importance,
+        original_means=original_means,
+        counts=counts,
+        stds=stds,
+    )
 
-            factor_stats[english_name] = {
-                "mean_importance": inverted_mean,
-                "original_mean": valid_data.mean(),
-                "count": len(valid_data),
-                "std": valid_data.std(),
-            }
+    print(f"🛣️  Route Choice Factor Analysis:")
+    print(f"Note: Scale is 1-5 where 1=Most Important, 5=Least Important")
 
+    for name, count, mean, inverted in zip(
+        factor_stats.names, counts, original_means, importance
+    ):
+        if count > 0:
             print(
-                f"  {english_name}: {len(valid_data)} responses, avg={valid_data.mean():.2f} (importance={inverted_mean:.2f})"
+                f"  {name}: {count} responses, avg={mean:.2f} (importance={inverted:.2f})"
             )
-        else:
-            factor_stats[english_name] = {
-                "mean_importance": 0,
-                "original_mean": 0,
-                "count": 0,
-                "std": 0,
-            }
 
-    return factor_stats, route_data
+    return factor_stats, factor_stats.ranked(), route_data
 
 
-def create_spider_chart(factor_stats: dict) -> go.Figure:
+def create_spider_chart(factor_stats: FactorStats) -> go.Figure:
     """Create a spider/radar chart optimized for iframe embedding."""
 
-    # Prepare data for spider chart
-    factors = list(factor_stats.keys())
-    values = [factor_stats[factor]["mean_importance"] for factor in factors]
-    counts = [factor_stats[factor]["count"] for factor in factors]
-
     # Close the polygon by adding first value at the end
-    factors_closed = factors + [factors[0]]
-    values_closed = values + [values[0]]
-    counts_closed = counts + [counts[0]]
+    values_closed = close(factor_stats.importance)
+    counts_closed = close(factor_stats.counts)
 
     fig = go.Figure()
 
-    # Add background grid lines for better readability
-    for i in range(1, 6):
-        fig.add_trace(
-            go.Scatterpolar(
-                r=[i] * len(factors_closed),
-                theta=factors_closed,
-                mode="lines",
-                line=dict(color="rgba(255,255,255,0.05)", width=1),
-                showlegend=False,
-                hoverinfo="skip",
-            )
-        )
-
-    # Add shadow/background trace for depth
+    # Add background grid lines for better readability as a single trace;
+    # a NaN radius after each ring breaks the line before the next one starts
+    ring_size = len(THETA_CLOSED) + 1
+    ring_r = np.repeat(np.arange(1, 6, dtype=np.float64), ring_size)
+    ring_r[ring_size - 1 :: ring_size] = np.nan
     fig.add_trace(
         go.Scatterpolar(
-            r=values_closed,
-            theta=factors_closed,
-            fill="toself",
-            fillcolor="rgba(0, 255, 136, 0.1)",
-            line=dict(color="rgba(0, 255, 136, 0.4)", width=6),
+            r=ring_r,
+            theta=(THETA_CLOSED + FACTOR_LABELS[:1]) * 5,
+            mode="lines",
+            line=dict(color="rgba(255,255,255,0.05)", width=1),
             showlegend=False,
             hoverinfo="skip",
         )
@@ -108,7 +162,7 @@ def create_spider_chart(factor_stats: dict) -> go.Figure:
     fig.add_trace(
         go.Scatterpolar(
             r=values_closed,
-            theta=factors_closed,
+            theta=THETA_CLOSED,
             fill="toself",
             fillcolor="rgba(0, 212, 255, 0.4)",
             line=dict(color="#00d4ff", width=4),
@@ -183,28 +237,14 @@ def create_spider_chart(factor_stats: dict) -> go.Figure:
     return fig
 
 
-def create_factor_comparison_chart(factor_stats: dict) -> go.Figure:
-    """Create a vertical bar chart comparing factor importance - iframe optimized."""
-
-    # Sort factors by importance
-    sorted_factors = sorted(
-        factor_stats.items(), key=lambda x: x[1]["mean_importance"], reverse=True
-    )
+def create_factor_comparison_chart(ranked_stats: FactorStats) -> go.Figure:
+    """Create a vertical bar chart comparing factor importance - iframe optimized.
 
-    factors = [item[0] for item in sorted_factors]
-    importance = [item[1]["mean_importance"] for item in sorted_factors]
-    counts = [item[1]["count"] for item in sorted_factors]
-
-    # Green gradient - lighter greens for higher importance
-    colors = [
-        "#6ee7b7",  # Very light green (most important)
-        "#34d399",  # Light green
-        "#10b981",  # Medium-light green
-        "#059669",  # Medium green
-        "#047857",  # Medium-dark green
-        "#065f46",  # Dark green
-        "#064e3b",  # Very dark green (least important)
-    ]
+    Expects factors already ranked by importance (see ``FactorStats.ranked``).
+    """
+    factors = ranked_stats.names
+    importance = ranked_stats.importance
+    counts = ranked_stats.counts
 
     fig = go.Figure()
 
@@ -213,7 +253,7 @@ def create_factor_comparison_chart(factor_stats: dict) -> go.Figure:
             x=factors,
             y=importance,
             marker=dict(
-                color=colors[: len(factors)],
+                color=COMPARISON_COLORS[: len(factors)],
                 line=dict(color="rgba(255,255,255,0.15)", width=1),
                 opacity=0.9,
             ),
@@ -271,139 +311,31 @@ def create_factor_comparison_chart(factor_stats: dict) -> go.Figure:
     return fig
 
 
-def create_iframe_optimized_html(fig: go.Figure, filename: str, title: str) -> None:
-    """Create HTML file specifically optimized for iframe embedding."""
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <script src="https://cdn.plot.ly/plotly-2.26.0.min.js"></script>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            font-family: 'Inter', system-ui, sans-serif;
-            overflow: hidden;  /* Prevent scrollbars in iframe */
-        }}
-        
-        #plotly-div {{
-            width: 100%;
-            height: 100vh;  /* Full viewport height */
-            margin: 0;
-            padding: 0;
-        }}
-        
-        /* Ensure Plotly toolbar is accessible but minimal */
-        .modebar {{
-            opacity: 0.3;
-            transition: opacity 0.3s ease;
-        }}
-        
-        .modebar:hover {{
-            opacity: 1;
-        }}
-        
-        /* Custom scrollbar for any overflow */
-        ::-webkit-scrollbar {{
-            width: 4px;
-        }}
-        
-        ::-webkit-scrollbar-track {{
-            background: rgba(255,255,255,0.1);
-        }}
-        
-        ::-webkit-scrollbar-thumb {{
-            background: rgba(255,255,255,0.3);
-            border-radius: 2px;
-        }}
-    </style>
-</head>
-<body>
-    <div id="plotly-div"></div>
-    
-    <script>
-        // Get the figure data from Python
-        var figureJSON = {fig.to_json()};
-        
-        // Configuration optimized for iframe
-        var config = {{
-            displayModeBar: true,
-            displaylogo: false,
-            modeBarButtonsToRemove: ['pan2d', 'lasso2d', 'select2d', 'autoScale2d'],
-            responsive: true,
-            toImageButtonOptions: {{
-                format: 'png',
-                filename: '{title.lower().replace(" ", "_")}',
-                height: 800,
-                width: 1200,
-                scale: 2
-            }}
-        }};
-        
-        // Create the plot
-        Plotly.newPlot('plotly-div', figureJSON.data, figureJSON.layout, config);
-        
-        // Handle window resize for iframe
-        window.addEventListener('resize', function() {{
-            Plotly.Plots.resize('plotly-div');
-        }});
-        
-        // Initial resize to fit container
-        setTimeout(function() {{
-            Plotly.Plots.resize('plotly-div');
-        }}, 100);
-    </script>
-</body>
-</html>"""
-
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-
-def export_figure(fig: go.Figure, filename_base: str, title: str) -> None:
-    """Export figure as both optimized HTML and PNG."""
-    html_path = f"outputs/{filename_base}.html"
-    png_path = f"outputs/{filename_base}.png"
-
-    # Create iframe-optimized HTML
-    create_iframe_optimized_html(fig, html_path, title)
-    print(f"✓ Saved iframe-optimized HTML: {html_path}")
-
-    # Export PNG with high resolution
-    try:
-        fig.write_image(png_path, width=1920, height=1080, scale=2, engine="kaleido")
-        print(f"✓ Saved PNG: {png_path}")
-    except Exception as e:
-        print(f"⚠️  PNG export failed for {filename_base}: {e}")
-        print("   Install kaleido: pip install kaleido")
-
-
 def main():
     """Main function to create route choice visualizations."""
     print("🛣️  Creating Route Choice Factor Visualizations (Iframe Optimized)")
     print("=" * 65)
 
-    # Load data
-    df = data_loader.load_processed_data()
+    # Load only the route choice columns
+    df = data_loader.load_processed_data(columns=list(ROUTE_CHOICE_FACTORS))
 
     # Prepare route choice data
-    factor_stats, route_data = prepare_route_choice_data(df)
+    factor_stats, ranked_stats, route_data = prepare_route_choice_data(df)
 
     # Create spider chart with iframe optimization
     spider_fig = create_spider_chart(factor_stats)
-    export_figure(spider_fig, "route_choice_spider", "Route Choice Spider Chart")
+    exporter.export_figure(
+        spider_fig, "route_choice_spider", "Route Choice Spider Chart"
+    )
 
     # Create comparison bar chart
-    comparison_fig = create_factor_comparison_chart(factor_stats)
-    export_figure(comparison_fig, "route_choice_comparison", "Route Choice Comparison")
+    comparison_fig = create_factor_comparison_chart(ranked_stats)
+    exporter.export_figure(
+        comparison_fig, "route_choice_comparison", "Route Choice Comparison"
+    )
 
     print("\n🎯 Route choice analysis completed!")
     print("📱 HTML files are now optimized for iframe embedding")
-    print("🖼️  PNG files exported at 1920x1080 resolution")
     print("✨ Features:")
     print("   • Transparent background for seamless integration")
     print("   • Responsive sizing that fills iframe container")
@@ -9,9 +9,24 @@ import plotly.graph_objects as go
 import numpy as np
 import os
 import json
+from typing import List, Optional, Tuple
 
 from viz_utils import data_loader, styling, exporter, processor
 
+# Vega-inspired color palette for transportation modes
+TRANSPORT_COLORS = styling.TRANSPORT_COLORS
+
+# Transportation mode display names without emojis
+MODE_DISPLAY_NAMES = {
+    "walking": "Walking",
+    "bicycle": "Bicycle",
+    "ebike": "E-bike",
+    "car": "Car",
+    "bus": "Bus",
+    "train": "Train",
+    "unknown": "Unknown",
+}
+
 
 def get_transport_mode_data(df: pd.DataFrame) -> dict:
     """Extract transportation mode data from routes."""
@@ -28,57 +43,57 @@ def get_transport_mode_data(df: pd.DataFrame) -> dict:
         # Fallback: parse from raw data
         mode_translation = processor.get_transport_mode_mapping()
 
-        mode_counts = {
-            "walking": 0,
-            "bicycle": 0,
-            "ebike": 0,
-            "car": 0,
-            "bus": 0,
-            "train": 0,
-            "unknown": 0,
-        }
-
-        for idx, row in df.iterrows():
-            transport_mode = row.get("Transportation-Mode", "")
-            if pd.isna(transport_mode) or transport_mode == "":
-                english_mode = "unknown"
-            else:
-                english_mode = mode_translation.get(transport_mode, "unknown")
-
-            mode_counts[english_mode] += 1
-
-        # Remove modes with 0 counts
-        mode_counts = {k: v for k, v in mode_counts.items() if v > 0}
+        # Encode responses against the known Hebrew modes; missing, empty and
+        # unrecognised modes all get code -1 and count as "unknown"
+        if "Transportation-Mode" in df.columns:
+            responses = df["Transportation-Mode"]
+        else:
+            responses = pd.Series(index=df.index, dtype=object)
+        codes = pd.Categorical(responses, categories=list(mode_translation)).codes
+
+        # Count every code in one pass; slot 0 holds the unknown responses
+        counts = np.bincount(codes + 1, minlength=len(mode_translation) + 1)
+
+        # Several Hebrew spellings share an English mode; drop modes with 0 counts
+        mode_counts = {}
+        for mode, count in zip(["unknown", *mode_translation.values()], counts):
+            if count:
+                mode_counts[mode] = mode_counts.get(mode, 0) + int(count)
         return mode_counts
 
 
-def create_transport_donut_chart(transport_data: dict) -> go.Figure:
-    """Create donut chart for transportation modes with Vega-inspired styling."""
+def sort_modes_by_count(transport_data: dict) -> List[Tuple[str, int]]:
+    """Sort (mode, count) pairs by frequency, most common first."""
+    return sorted(transport_data.items(), key=lambda x: x[1], reverse=True)
 
-    # Vega-inspired color palette for transportation modes
-    transport_colors = styling.TRANSPORT_COLORS
 
-    # Transportation mode display names without emojis
-    mode_display_names = {
-        "walking": "Walking",
-        "bicycle": "Bicycle",
-        "ebike": "E-bike",
-        "car": "Car",
-        "bus": "Bus",
-        "train": "Train",
-        "unknown": "Unknown",
-    }
+def create_transport_donut_chart(
+    transport_data: dict,
+    sorted_modes: Optional[List[Tuple[str, int]]] = None,
+    total: Optional[int] = None,
+) -> go.Figure:
+    """Create donut chart for transportation modes with Vega-inspired styling.
 
-    # Prepare data - sort by frequency
-    sorted_modes = sorted(transport_data.items(), key=lambda x: x[1], reverse=True)
-    modes = [mode for mode, count in sorted_modes]
-    values = [count for mode, count in sorted_modes]
-    colors = [transport_colors.get(mode, "#808080") for mode in modes]
-    display_names = [mode_display_names.get(mode, mode.title()) for mode in modes]
+    ``sorted_modes`` and ``total`` may be passed when the caller already has
+    them; otherwise they are derived from ``transport_data``.
+    """
 
-    # Calculate percentages
-    total = sum(values)
-    percentages = [(v / total) * 100 for v in values]
+    # Prepare data - sort by frequency
+    if sorted_modes is None:
+        sorted_modes = sort_modes_by_count(transport_data)
+    values = []
+    colors = []
+    display_names = []
+    for mode, count in sorted_modes:
+        values.append(count)
+        colors.append(TRANSPORT_COLORS.get(mode, "#808080"))
+        display_names.append(MODE_DISPLAY_NAMES.get(mode, mode.title()))
+
+    # Slice percentages are computed by plotly.js (%{percent}); only the total
+    # is needed here
+    values = np.asarray(values, dtype=np.int64)
+    if total is None:
+        total = int(values.sum())
 
     fig = go.Figure()
 
@@ -163,129 +178,27 @@ def create_transport_donut_chart(transport_data: dict) -> go.Figure:
     return fig
 
 
-def _removed_create_iframe_optimized_html(
-    fig: go.Figure, filename: str, title: str
-) -> None:
-    """Create HTML file specifically optimized for iframe embedding."""
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <script src="https://cdn.plot.ly/plotly-2.26.0.min.js"></script>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%);
-            font-family: 'Inter', system-ui, sans-serif;
-            overflow: hidden;
-        }}
-        
-        #plotly-div {{
-            width: 100%;
-            height: 100vh;
-            margin: 0;
-            padding: 0;
-        }}
-        
-        .modebar {{
-            opacity: 0.3;
-            transition: opacity 0.3s ease;
-        }}
-        
-        .modebar:hover {{
-            opacity: 1;
-        }}
-        
-        /* Smooth hover transitions without overlap */
-        .js-plotly-plot .plotly .slice {{
-            transition: opacity 0.2s ease;
-        }}
-        
-        .js-plotly-plot .plotly .slice:hover {{
-            opacity: 0.9;
-        }}
-    </style>
-</head>
-<body>
-    <div id="plotly-div"></div>
-    
-    <script>
-        var figureJSON = {fig.to_json()};
-        
-        var config = {{
-            displayModeBar: true,
-            displaylogo: false,
-            modeBarButtonsToRemove: ['pan2d', 'lasso2d', 'select2d', 'autoScale2d'],
-            responsive: true,
-            staticPlot: false,
-            toImageButtonOptions: {{
-                format: 'png',
-                filename: '{title.lower().replace(" ", "_")}',
-                height: 800,
-                width: 1200,
-                scale: 2
-            }}
-        }};
-        
-        Plotly.newPlot('plotly-div', figureJSON.data, figureJSON.layout, config);
-        
-        // Disable legend clicking to make it static
-        document.getElementById('plotly-div').on('plotly_legendclick', function() {{
-            return false;
-        }});
-        document.getElementById('plotly-div').on('plotly_legenddoubleclick', function() {{
-            return false;
-        }});
-        
-        window.addEventListener('resize', function() {{
-            Plotly.Plots.resize('plotly-div');
-        }});
-        
-        setTimeout(function() {{
-            Plotly.Plots.resize('plotly-div');
-        }}, 100);
-    </script>
-</body>
-</html>"""
-
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-
-def _removed_export_figure(fig: go.Figure, filename_base: str, title: str) -> None:
-    """Export figure as both optimized HTML and PNG."""
-    html_path = f"outputs/{filename_base}.html"
-    png_path = f"outputs/{filename_base}.png"
-
-    _removed_create_iframe_optimized_html(fig, html_path, title)
-    print(f"✓ Saved iframe-optimized HTML: {html_path}")
-
-    try:
-        fig.write_image(png_path, width=1200, height=800, scale=2, engine="kaleido")
-        print(f"✓ Saved PNG: {png_path}")
-    except Exception as e:
-        print(f"⚠️  PNG export failed: {e}")
-
-
 def main():
     """Main function to create transportation modes donut chart."""
 
-    # Load data
-    df = data_loader.load_processed_data()
+    # Load only the column the fallback counts read
+    df = data_loader.load_processed_data(columns=["Transportation-Mode"])
 
     # Get transportation mode data
     transport_data = get_transport_mode_data(df)
 
-    if not transport_data or sum(transport_data.values()) == 0:
+    # Sort and total once for both the chart and the printed statistics
+    sorted_modes = sort_modes_by_count(transport_data)
+    total_trips = sum(count for _, count in sorted_modes)
+
+    if total_trips == 0:
         print("⚠️  No transportation mode data found!")
         return None
 
     # Create donut chart
-    fig = create_transport_donut_chart(transport_data)
+    fig = create_transport_donut_chart(
+        transport_data, sorted_modes=sorted_modes, total=total_trips
+    )
     exporter.export_figure(
         fig,
         "transport_modes_donut",
@@ -294,9 +207,8 @@ def main():
     )
 
     # Print statistics
-    total_trips = sum(transport_data.values())
     print(f"\n📊 Transportation Mode Statistics:")
-    for mode, count in sorted(transport_data.items(), key=lambda x: x[1], reverse=True):
+    for mode, count in sorted_modes:
         percentage = (count / total_trips) * 100
         print(f"   • {mode.title()}: {count} trips ({percentage:.1f}%)")
 
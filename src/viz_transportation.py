@@ -4,33 +4,46 @@ BGU Mobility Survey - Transportation Mode Analysis
 Creates sleek, modern interactive bar charts optimized for iframe embedding.
 """
 
+from typing import Any, Dict
+
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import json
 import os
 
 from viz_utils import data_loader, styling, exporter, processor, chart_builder
 
+# Hebrew to English display names, built once at import
+MODE_DISPLAY_NAMES = processor.get_transport_mode_display_mapping()
+
 
 def prepare_transportation_data(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and prepare transportation mode data."""
     # Filter out empty transportation mode responses
     transport_data = df[df["Transportation-Mode"].notna()].copy()
 
-    # Hebrew to English mapping for better presentation
-    mode_mapping = processor.get_transport_mode_display_mapping()
-
-    transport_data["Transport_English"] = transport_data["Transportation-Mode"].map(
-        mode_mapping
+    # Hebrew to English mapping for better presentation, applied to the
+    # categories rather than every row; unmapped modes keep their Hebrew label
+    modes = transport_data["Transportation-Mode"].astype("category")
+    english_names = {
+        hebrew: MODE_DISPLAY_NAMES.get(hebrew, hebrew)
+        for hebrew in modes.cat.categories
+    }
+    if len(set(english_names.values())) == len(english_names):
+        transport_data["Transport_English"] = modes.cat.rename_categories(
+            english_names
+        )
+    else:
+        # Several answers share a display name ("" and "Unknown"); merge them
+        transport_data["Transport_English"] = modes.map(english_names).astype(
+            "category"
+        )
+
+    # Count on object dtype: categorical value_counts orders tied counts by
+    # category, not by first appearance as the charts always have
+    transport_counts = (
+        transport_data["Transport_English"].astype(object).value_counts().reset_index()
     )
-    transport_data["Transport_English"] = transport_data["Transport_English"].fillna(
-        transport_data["Transportation-Mode"]
-    )
-
-    # Get counts
-    transport_counts = transport_data["Transport_English"].value_counts().reset_index()
     transport_counts.columns = ["Mode", "Count"]
 
     # Calculate percentages
@@ -39,19 +52,24 @@ def prepare_transportation_data(df: pd.DataFrame) -> pd.DataFrame:
     ).round(1)
 
     print(f"📊 Transportation Mode Distribution:")
-    for _, row in transport_counts.iterrows():
-        print(f"  {row['Mode']}: {row['Count']} ({row['Percentage']}%)")
+    for mode, count, percentage in transport_counts.itertuples(index=False):
+        print(f"  {mode}: {count} ({percentage}%)")
 
     return transport_counts
 
 
-def create_transportation_bar_chart(transport_counts: pd.DataFrame) -> go.Figure:
-    """Create a sleek, modern interactive bar chart optimized for iframe embedding."""
-    return chart_builder.create_bar_chart(
-        x_data=transport_counts["Mode"].tolist(),
-        y_data=transport_counts["Count"].tolist(),
+def create_transportation_bar_chart(transport_counts: pd.DataFrame) -> Dict[str, Any]:
+    """Create a sleek, modern interactive bar chart optimized for iframe embedding.
+
+    The chart is only exported, so it is built as a plain figure dict.
+    """
+    return chart_builder.create_bar_chart_dict(
+        x_data=transport_counts["Mode"].to_numpy(dtype=object),
+        y_data=transport_counts["Count"].to_numpy(dtype=np.int32),
         title="Transportation to BGU University",
-        customdata=transport_counts["Percentage"].tolist(),
+        # float64 rather than float32 so the hover keeps the rounded 12.3,
+        # not 12.300000190734863; both are sent as typed arrays
+        customdata=transport_counts["Percentage"].to_numpy(dtype=np.float64),
         hovertemplate="<b>%{x}</b><br>Responses: %{y}<br>Percentage: %{customdata}%<extra></extra>",
     )
 
@@ -61,8 +79,8 @@ def main():
     print("🚗 Creating Transportation Mode Visualization (Iframe Optimized)")
     print("=" * 60)
 
-    # Load data
-    df = data_loader.load_processed_data()
+    # Load only the transportation mode column
+    df = data_loader.load_processed_data(columns=["Transportation-Mode"])
 
     # Prepare transportation data
     transport_counts = prepare_transportation_data(df)
@@ -5,41 +5,234 @@ Consolidated functions for data loading, export, and styling across all visualiz
 Maintains exact output compatibility while reducing code duplication.
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 import os
 import json
-from typing import Dict, Any, Optional
+import atexit
+import base64
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 import logging
+from string import Template
+
+from data_manager import DataManager
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to Plotly's JSON encoder
+    orjson = None
+else:
+    # Route fig.to_json() and fig.write_html() through orjson as well
+    pio.json.config.default_engine = "orjson"
 
 logger = logging.getLogger(__name__)
 
+# plotly.js partial bundles and the trace types each one supports; 2.28+ is
+# needed to decode typed-array (base64) trace data
+PLOTLY_JS_VERSION = "2.35.2"
+_PLOTLY_JS_BUNDLES = (
+    ("basic", frozenset({"bar", "pie", "scatter"})),
+    (
+        "cartesian",
+        frozenset(
+            {
+                "bar",
+                "box",
+                "contour",
+                "heatmap",
+                "histogram",
+                "histogram2d",
+                "histogram2dcontour",
+                "image",
+                "pie",
+                "scatter",
+                "scatterternary",
+                "violin",
+            }
+        ),
+    ),
+)
+
+# Byte sequences escaped in inline figure JSON, matching plotly.io's to_json;
+# they only occur inside JSON strings, where the \u escapes decode identically
+_SCRIPT_SAFE_ESCAPES = (
+    (b"<", b"\\u003c"),
+    (b">", b"\\u003e"),
+    (b"/", b"\\u002f"),
+    ("\u2028".encode("utf-8"), b"\\u2028"),
+    ("\u2029".encode("utf-8"), b"\\u2029"),
+)
+
+# Iframe HTML shell filled by create_iframe_optimized_html; the figure JSON is
+# streamed between the compiled head and tail templates
+_IFRAME_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+    <script id="plotly-js" src="$plotly_js" async></script>
+    <style>
+        body {
+            margin: 0;
+            padding: 0;
+            background: $background;
+            font-family: 'Inter', system-ui, sans-serif;
+            overflow: hidden;
+        }
+        
+        #plotly-div {
+            width: 100%;
+            height: 100vh;
+            margin: 0;
+            padding: 0;
+        }
+        
+        .modebar {
+            opacity: 0.3;
+            transition: opacity 0.3s ease;
+        }
+        
+        .modebar:hover {
+            opacity: 1;
+        }
+        
+        ::-webkit-scrollbar {
+            width: 4px;
+        }
+        
+        ::-webkit-scrollbar-track {
+            background: rgba(255,255,255,0.1);
+        }
+        
+        ::-webkit-scrollbar-thumb {
+            background: rgba(255,255,255,0.3);
+            border-radius: 2px;
+        }
+    </style>
+</head>
+<body>
+    <div id="plotly-div"></div>
+    
+    <script>
+        var figureJSON = $fig_json;
+        
+        var config = {
+            displayModeBar: true,
+            displaylogo: false,
+            modeBarButtonsToRemove: ['pan2d', 'lasso2d', 'select2d', 'autoScale2d'],
+            responsive: true,
+            toImageButtonOptions: {
+                format: 'png',
+                filename: '$safe_title',
+                height: 800,
+                width: 1200,
+                scale: 2
+            }
+        };
+        
+        function renderFigure() {
+            Plotly.newPlot('plotly-div', figureJSON.data, figureJSON.layout, config);
+            
+            // Coalesce resize bursts into at most one relayout per frame
+            var resizeFrame = null;
+            window.addEventListener('resize', function() {
+                if (resizeFrame !== null) cancelAnimationFrame(resizeFrame);
+                resizeFrame = requestAnimationFrame(function() {
+                    resizeFrame = null;
+                    Plotly.Plots.resize('plotly-div');
+                });
+            });
+            
+            setTimeout(function() {
+                Plotly.Plots.resize('plotly-div');
+            }, 100);
+        }
+        
+        // plotly.js loads async; render now if it already ran, else on load
+        if (window.Plotly) {
+            renderFigure();
+        } else {
+            document.getElementById('plotly-js').addEventListener('load', renderFigure);
+        }
+    </script>
+</body>
+</html>"""
+_IFRAME_HTML_HEAD, _IFRAME_HTML_TAIL = map(Template, _IFRAME_HTML.split("$fig_json"))
+
 
 class VizDataLoader:
     """Centralized data loading with caching and validation."""
 
+    PROCESSED_DATA_PATH = "data/processed_mobility_data.csv"
+    PROCESSED_PARQUET_PATH = "data/processed_mobility_data.parquet"
+    RAW_DATA_PATH = "data/mobility-data.csv"
+
     def __init__(self):
-        self._cache: Dict[str, pd.DataFrame] = {}
+        self._cache: Dict[Any, pd.DataFrame] = {}
+        self._cache_mtime: Optional[float] = None
+        self._json_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    # One CSV reader and Parquet sidecar writer, shared with DataManager so
+    # both loaders see the same cached dtypes
+    read_csv = staticmethod(DataManager.read_csv)
+    present_columns = staticmethod(DataManager.present_columns)
+    read_csv_cached = staticmethod(DataManager.read_csv_cached)
+
+    def _read_processed_data(self, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Read processed data from its Parquet sidecar, rebuilding it when stale."""
+        return self.read_csv_cached(
+            self.PROCESSED_DATA_PATH, columns, self.PROCESSED_PARQUET_PATH
+        )
+
+    def _invalidate_stale_cache(self) -> None:
+        """Drop cached frames when the processed CSV has changed on disk."""
+        try:
+            mtime = os.path.getmtime(self.PROCESSED_DATA_PATH)
+        except OSError:
+            mtime = None
+
+        if mtime != self._cache_mtime:
+            self._cache.clear()
+            self._cache_mtime = mtime
 
-    def load_processed_data(self) -> pd.DataFrame:
-        """Load the processed survey data with fallback to raw data processing."""
-        cache_key = "processed_data"
+    def load_processed_data(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load the processed survey data with fallback to raw data processing.
+
+        Pass ``columns`` to load only the fields a visualization consumes.
+        Frames are cached for the process and reloaded if the CSV changes.
+        """
+        self._invalidate_stale_cache()
+
+        cache_key = "processed_data" if columns is None else tuple(columns)
 
         if cache_key in self._cache:
             return self._cache[cache_key]
 
+        # Serve column subsets from an already-loaded full frame
+        if columns is not None and "processed_data" in self._cache:
+            full_df = self._cache["processed_data"]
+            df = full_df[self.present_columns(columns, full_df.columns)]
+            self._cache[cache_key] = df
+            return df
+
         try:
-            df = pd.read_csv("data/processed_mobility_data.csv")
+            df = self._read_processed_data(columns)
             print(f"✓ Loaded processed data: {df.shape[0]} rows")
             self._cache[cache_key] = df
             return df
         except FileNotFoundError:
             print("⚠️  Processed data not found, loading raw data...")
-            df = pd.read_csv("data/mobility-data.csv")
+            df = self.read_csv(self.RAW_DATA_PATH)
 
             # Apply the same processing logic that was in individual files
             df = self._process_raw_data_fallback(df)
+            if columns is not None:
+                df = df[self.present_columns(columns, df.columns)]
             self._cache[cache_key] = df
             return df
 
@@ -77,11 +270,23 @@ class VizDataLoader:
         return df_processed
 
     def load_exported_data(self, file_path: str) -> Dict[str, Any]:
-        """Load exported JSON data with validation."""
+        """Load exported JSON data with validation.
+
+        Parsed payloads are cached per path and reused until the file changes.
+        """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            mtime = os.path.getmtime(file_path)
+            cached = self._json_cache.get(file_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+            if orjson is not None:
+                data = orjson.loads(Path(file_path).read_bytes())
+            else:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
             print(f"✓ Loaded exported data from: {file_path}")
+            self._json_cache[file_path] = (mtime, data)
             return data
         except FileNotFoundError:
             print(f"⚠️  Exported data not found: {file_path}")
@@ -114,8 +319,9 @@ class VizStyling:
         "West Gate": "#FF9800",  # Orange
     }
 
-    # Modern vibrant colors for bar charts
-    MODERN_COLORS = [
+    # Modern vibrant colors for bar charts (a tuple, so the shared palette
+    # can be handed to traces without copying)
+    MODERN_COLORS = (
         "#00d4ff",  # Cyan
         "#ff6b6b",  # Coral
         "#4ecdc4",  # Teal
@@ -123,7 +329,7 @@ class VizStyling:
         "#96ceb4",  # Mint
         "#ffeaa7",  # Warm yellow
         "#dda0dd",  # Plum
-    ]
+    )
 
     # Common layout settings
     @staticmethod
@@ -146,8 +352,7 @@ class VizStyling:
             "hoverlabel": {
                 "bgcolor": "rgba(15,15,15,0.95)",
                 "bordercolor": "rgba(255,255,255,0.3)",
-                "font_size": 14,
-                "font_family": VizStyling.FONT_FAMILY,
+                "font": {"size": 14, "family": VizStyling.FONT_FAMILY},
             },
         }
 
@@ -159,14 +364,111 @@ class VizStyling:
 class VizExporter:
     """Centralized export functionality maintaining exact output compatibility."""
 
+    # PNG renders run on a shared pool so they overlap the HTML writes and
+    # each other; kaleido renders out of process, so the GIL is not a factor
+    _png_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="png-export")
+    _png_futures: List[Future] = []
+
+    # PNG exports are opt-in for a whole run via BGU_EXPORT_PNG=1
+    EXPORT_PNG = os.environ.get("BGU_EXPORT_PNG") == "1"
+
     @staticmethod
     def ensure_outputs_dir():
         """Ensure outputs directory exists."""
         os.makedirs("outputs", exist_ok=True)
 
+    # NumPy dtypes plotly.js can read from a base64 typed-array spec
+    _TYPED_ARRAY_DTYPES = {
+        "int8": "i1",
+        "uint8": "u1",
+        "int16": "i2",
+        "uint16": "u2",
+        "int32": "i4",
+        "uint32": "u4",
+        "float32": "f4",
+        "float64": "f8",
+    }
+
+    @staticmethod
+    def _typed_array_spec(arr: np.ndarray) -> Optional[Dict[str, str]]:
+        """Encode a numeric array as a plotly.js typed-array spec, if supported."""
+        if arr.dtype == np.int64 and arr.size:
+            # plotly.js has no 64-bit integer arrays; narrow when values fit
+            info = np.iinfo(np.int32)
+            if arr.min() < info.min or arr.max() > info.max:
+                return None
+            arr = arr.astype(np.int32)
+
+        code = VizExporter._TYPED_ARRAY_DTYPES.get(arr.dtype.name)
+        if code is None:
+            return None
+
+        data = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder("<"))
+        spec = {
+            "dtype": code,
+            "bdata": base64.b64encode(data.tobytes()).decode("ascii"),
+        }
+        if arr.ndim > 1:
+            spec["shape"] = ",".join(map(str, arr.shape))
+        return spec
+
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        """Convert values orjson cannot encode natively.
+
+        Numeric arrays become base64 typed-array specs; other arrays, NumPy
+        scalars and timestamps fall back to plain JSON values.
+        """
+        if isinstance(obj, np.ndarray):
+            spec = VizExporter._typed_array_spec(obj)
+            if spec is not None:
+                return spec
+        if hasattr(obj, "tolist"):
+            return obj.tolist()
+        if hasattr(obj, "isoformat"):
+            return obj.isoformat()
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    @staticmethod
+    def _figure_dict(fig: Union[go.Figure, Dict[str, Any]]) -> Dict[str, Any]:
+        """Get a figure's plain data/layout dict, passing dicts through unchanged."""
+        return fig if isinstance(fig, dict) else fig.to_plotly_json()
+
+    @staticmethod
+    def figure_to_json_bytes(fig: Union[go.Figure, Dict[str, Any]]) -> bytes:
+        """Serialize a figure to UTF-8 JSON, using orjson when it is installed."""
+        fig_dict = VizExporter._figure_dict(fig)
+        if orjson is None:
+            return pio.to_json(fig_dict, validate=False, pretty=False).encode("utf-8")
+        # No OPT_SERIALIZE_NUMPY: arrays go through _json_default so numeric
+        # data is embedded as compact typed arrays rather than number lists
+        json_bytes = orjson.dumps(fig_dict, default=VizExporter._json_default)
+        # The JSON is inlined in a <script>; escape like plotly.io's to_json so
+        # figure text such as "</script>" cannot end the script block
+        for raw, escaped in _SCRIPT_SAFE_ESCAPES:
+            json_bytes = json_bytes.replace(raw, escaped)
+        return json_bytes
+
+    @staticmethod
+    def figure_to_json(fig: Union[go.Figure, Dict[str, Any]]) -> str:
+        """Serialize a figure to a JSON string, using orjson when it is installed."""
+        return VizExporter.figure_to_json_bytes(fig).decode("utf-8")
+
+    @staticmethod
+    def plotly_js_url(fig: Union[go.Figure, Dict[str, Any]]) -> str:
+        """Get the smallest plotly.js CDN bundle that can render the figure's traces."""
+        trace_types = {
+            trace.get("type", "scatter")
+            for trace in VizExporter._figure_dict(fig)["data"]
+        }
+        for bundle, supported in _PLOTLY_JS_BUNDLES:
+            if trace_types <= supported:
+                return f"https://cdn.plot.ly/plotly-{bundle}-{PLOTLY_JS_VERSION}.min.js"
+        return f"https://cdn.plot.ly/plotly-{PLOTLY_JS_VERSION}.min.js"
+
     @staticmethod
     def create_iframe_optimized_html(
-        fig: go.Figure,
+        fig: Union[go.Figure, Dict[str, Any]],
         filename: str,
         title: str,
         background_gradient: str = "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
@@ -175,111 +477,55 @@ class VizExporter:
 
         Maintains exact compatibility with original implementations.
         """
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <script src="https://cdn.plot.ly/plotly-2.26.0.min.js"></script>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            background: {background_gradient};
-            font-family: 'Inter', system-ui, sans-serif;
-            overflow: hidden;
-        }}
-        
-        #plotly-div {{
-            width: 100%;
-            height: 100vh;
-            margin: 0;
-            padding: 0;
-        }}
-        
-        .modebar {{
-            opacity: 0.3;
-            transition: opacity 0.3s ease;
-        }}
-        
-        .modebar:hover {{
-            opacity: 1;
-        }}
-        
-        ::-webkit-scrollbar {{
-            width: 4px;
-        }}
-        
-        ::-webkit-scrollbar-track {{
-            background: rgba(255,255,255,0.1);
-        }}
-        
-        ::-webkit-scrollbar-thumb {{
-            background: rgba(255,255,255,0.3);
-            border-radius: 2px;
-        }}
-    </style>
-</head>
-<body>
-    <div id="plotly-div"></div>
-    
-    <script>
-        var figureJSON = {fig.to_json()};
-        
-        var config = {{
-            displayModeBar: true,
-            displaylogo: false,
-            modeBarButtonsToRemove: ['pan2d', 'lasso2d', 'select2d', 'autoScale2d'],
-            responsive: true,
-            toImageButtonOptions: {{
-                format: 'png',
-                filename: '{title.lower().replace(" ", "_")}',
-                height: 800,
-                width: 1200,
-                scale: 2
-            }}
-        }};
-        
-        Plotly.newPlot('plotly-div', figureJSON.data, figureJSON.layout, config);
-        
-        window.addEventListener('resize', function() {{
-            Plotly.Plots.resize('plotly-div');
-        }});
-        
-        setTimeout(function() {{
-            Plotly.Plots.resize('plotly-div');
-        }}, 100);
-    </script>
-</body>
-</html>"""
+        fig_dict = VizExporter._figure_dict(fig)
+        head = _IFRAME_HTML_HEAD.substitute(
+            title=title,
+            plotly_js=VizExporter.plotly_js_url(fig_dict),
+            background=background_gradient,
+        )
+        tail = _IFRAME_HTML_TAIL.substitute(safe_title=title.lower().replace(" ", "_"))
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        # Write the figure bytes straight through instead of building the page
+        # as one large string
+        with open(filename, "wb") as f:
+            f.write(head.encode("utf-8"))
+            f.write(VizExporter.figure_to_json_bytes(fig_dict))
+            f.write(tail.encode("utf-8"))
 
     @staticmethod
     def export_figure(
-        fig: go.Figure,
+        fig: Union[go.Figure, Dict[str, Any]],
         filename_base: str,
         title: str = None,
         use_iframe_html: bool = True,
         background_gradient: str = "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
+        png: Optional[bool] = None,
     ) -> None:
-        """Export figure as both HTML and PNG maintaining exact compatibility."""
+        """Export figure as HTML, and as a PNG when ``png`` is True.
+
+        PNG rendering starts a kaleido browser process, so it is skipped unless
+        ``png=True`` is passed, or ``png`` is left as None and the run sets
+        ``BGU_EXPORT_PNG=1``. ``fig`` may also be a plain data/layout dict,
+        which is exported as-is without validation.
+        """
         VizExporter.ensure_outputs_dir()
 
         html_path = f"outputs/{filename_base}.html"
         png_path = f"outputs/{filename_base}.png"
 
+        # Convert the figure once; the HTML and PNG writers share this dict
+        fig_dict = VizExporter._figure_dict(fig)
+
         if use_iframe_html:
             # Use iframe-optimized HTML (matches original implementations)
             VizExporter.create_iframe_optimized_html(
-                fig, html_path, title or filename_base, background_gradient
+                fig_dict, html_path, title or filename_base, background_gradient
             )
             print(f"✓ Saved iframe-optimized HTML: {html_path}")
         else:
             # Use standard HTML export (for files that used this approach)
-            fig.write_html(
+            pio.write_html(
+                fig_dict,
                 html_path,
                 config={
                     "displayModeBar": True,
@@ -292,20 +538,85 @@ class VizExporter:
                         "scale": 2,
                     },
                 },
-                include_plotlyjs="cdn",
+                # A path ending in .js is referenced as the script src
+                include_plotlyjs=VizExporter.plotly_js_url(fig_dict),
+                validate=False,
             )
             print(f"✓ Saved HTML: {html_path}")
 
+        if png is None:
+            png = VizExporter.EXPORT_PNG
+        if not png:
+            return
+
         # Export PNG with high resolution (maintaining original settings)
+        VizExporter.queue_png_export(fig_dict, png_path, filename_base)
+
+    @staticmethod
+    def queue_png_export(
+        fig: Union[go.Figure, Dict[str, Any]],
+        png_path: str,
+        filename_base: str,
+        width: int = 1920,
+        height: int = 1080,
+    ) -> None:
+        """Render a figure to PNG on the shared background kaleido workers.
+
+        Exports from one script overlap with each other and with the rest of the
+        script; wait_for_png_exports (also run at exit) joins them.
+        """
+        VizExporter._png_futures.append(
+            VizExporter._png_executor.submit(
+                VizExporter._write_png,
+                VizExporter._figure_dict(fig),
+                png_path,
+                filename_base,
+                width,
+                height,
+            )
+        )
+
+    @staticmethod
+    def _write_png(
+        fig_dict: Dict[str, Any],
+        png_path: str,
+        filename_base: str,
+        width: int,
+        height: int,
+    ) -> None:
+        """Render a figure dict to PNG with kaleido."""
+        # Animation and responsive sizing mean nothing in a static render; build
+        # a new layout rather than editing the dict shared with the HTML export
+        png_fig = {
+            "data": fig_dict["data"],
+            "layout": {
+                key: value
+                for key, value in fig_dict.get("layout", {}).items()
+                if key not in ("transition", "autosize")
+            },
+        }
         try:
-            fig.write_image(
-                png_path, width=1920, height=1080, scale=2, engine="kaleido"
+            png_bytes = pio.to_image(
+                png_fig,
+                format="png",
+                width=width,
+                height=height,
+                scale=2,
+                validate=False,
+                engine="kaleido",
             )
+            Path(png_path).write_bytes(png_bytes)
             print(f"✓ Saved PNG: {png_path}")
         except Exception as e:
             print(f"⚠️  PNG export failed for {filename_base}: {e}")
             print("   Install kaleido: pip install kaleido")
 
+    @staticmethod
+    def wait_for_png_exports() -> None:
+        """Block until all pending background PNG exports have finished."""
+        while VizExporter._png_futures:
+            VizExporter._png_futures.pop().result()
+
 
 class VizDataProcessor:
     """Centralized data processing utilities."""
@@ -467,52 +778,78 @@ class VizChartBuilder:
         customdata: list = None,
         hovertemplate: str = None,
     ) -> go.Figure:
-        """Create a standardized bar chart with common styling."""
-        fig = go.Figure()
+        """Create a standardized bar chart with common styling.
+
+        The trace and layout are passed to the Figure constructor as plain dicts,
+        so Plotly validates them once instead of per go.Bar/add_trace/update_layout.
+        """
+        return go.Figure(
+            VizChartBuilder.create_bar_chart_dict(
+                x_data, y_data, title, colors, customdata, hovertemplate
+            )
+        )
 
+    @staticmethod
+    def create_bar_chart_dict(
+        x_data: list,
+        y_data: list,
+        title: str,
+        colors: list = None,
+        customdata: list = None,
+        hovertemplate: str = None,
+    ) -> Dict[str, Any]:
+        """Build the bar chart as a plain data/layout dict without a go.Figure.
+
+        Scripts that only export the chart can hand this dict straight to
+        ``VizExporter.export_figure``, skipping Plotly's validation and the
+        deepcopy that ``to_plotly_json`` makes of every trace.
+        """
         if colors is None:
             colors = styling.MODERN_COLORS[: len(x_data)]
 
-        fig.add_trace(
-            go.Bar(
-                x=x_data,
-                y=y_data,
-                marker=dict(
-                    color=colors,
-                    line=dict(color="rgba(255,255,255,0.15)", width=1),
-                    opacity=0.9,
-                ),
-                hovertemplate=hovertemplate
-                or "<b>%{x}</b><br>Count: %{y}<extra></extra>",
-                customdata=customdata,
-            )
-        )
+        # One pass over the values feeds both the y-axis range and dtick
+        y_max = np.max(y_data).item() if len(y_data) else None
+
+        bar_trace = {
+            "type": "bar",
+            "x": x_data,
+            "y": y_data,
+            "marker": {
+                "color": colors,
+                "line": {"color": "rgba(255,255,255,0.15)", "width": 1},
+                "opacity": 0.9,
+            },
+            "hovertemplate": hovertemplate
+            or "<b>%{x}</b><br>Count: %{y}<extra></extra>",
+        }
+        if customdata is not None:
+            bar_trace["customdata"] = customdata
 
-        fig.update_layout(
+        layout = {
             **styling.get_common_layout(title),
-            xaxis=dict(
-                tickfont={"size": 14, "color": "rgba(255,255,255,0.9)"},
-                showgrid=False,
-                zeroline=False,
-                showline=False,
-                tickangle=-15,
-            ),
-            yaxis=dict(
-                tickfont={"size": 14, "color": "rgba(255,255,255,0.8)"},
-                showgrid=True,
-                gridwidth=0.5,
-                gridcolor="rgba(255,255,255,0.08)",
-                zeroline=False,
-                showline=False,
-                range=[0, max(y_data) * 1.1] if y_data else [0, 10],
-                dtick=max(1, max(y_data) // 5) if y_data else 1,
-            ),
-            margin=dict(l=60, r=40, t=100, b=50),
-            autosize=True,
-            showlegend=False,
-        )
+            "xaxis": {
+                "tickfont": {"size": 14, "color": "rgba(255,255,255,0.9)"},
+                "showgrid": False,
+                "zeroline": False,
+                "showline": False,
+                "tickangle": -15,
+            },
+            "yaxis": {
+                "tickfont": {"size": 14, "color": "rgba(255,255,255,0.8)"},
+                "showgrid": True,
+                "gridwidth": 0.5,
+                "gridcolor": "rgba(255,255,255,0.08)",
+                "zeroline": False,
+                "showline": False,
+                "range": [0, y_max * 1.1] if y_max is not None else [0, 10],
+                "dtick": max(1, y_max // 5) if y_max is not None else 1,
+            },
+            "margin": {"l": 60, "r": 40, "t": 100, "b": 50},
+            "autosize": True,
+            "showlegend": False,
+        }
 
-        return fig
+        return {"data": [bar_trace], "layout": layout}
 
     @staticmethod
     def create_pie_chart(
@@ -635,3 +972,5 @@ exporter = VizExporter()
 processor = VizDataProcessor()
 chart_builder = VizChartBuilder()
 map_utils = VizMapUtils()
+
+atexit.register(exporter.wait_for_png_exports)
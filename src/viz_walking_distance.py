@@ -11,18 +11,55 @@ import json
 from typing import Tuple
 import math
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
-from viz_utils import styling, exporter
+from viz_utils import data_loader, styling, exporter
 
 
 WALKING_HEBREW = "ברגל"
 ROUTE_SUMMARY_PATH = "outputs/route_summary_filtered.csv"
+REQUIRED_COLUMNS = ("transportation_mode", "total_distance_km")
 OUTPUT_HTML = "outputs/walking_distance.html"
 OUTPUT_PNG = "outputs/walking_distance.png"
 OUTPUT_STATS = "outputs/walking_distance_stats.json"
 
+# Static parts of the histogram layout, built once at import; only the
+# x-axis ticks depend on the data
+HISTOGRAM_XAXIS = {
+    "title": "Distance (km)",
+    "titlefont": {"size": 18, "color": "white"},
+    "tickfont": {"size": 14, "color": "rgba(255,255,255,0.95)"},
+    "gridcolor": "rgba(255,255,255,0.12)",
+    "tickmode": "array",
+}
+HISTOGRAM_LAYOUT = {
+    "title": {
+        "text": "Walking Distance to Campus",
+        "x": 0.5,
+        "xanchor": "center",
+        "font": {"size": 32, "color": "white", "family": styling.FONT_FAMILY},
+    },
+    "yaxis": {
+        "title": "% of all trips",
+        "titlefont": {"size": 18, "color": "white"},
+        "tickfont": {"size": 14, "color": "rgba(255,255,255,0.95)"},
+        "gridcolor": "rgba(255,255,255,0.12)",
+        "tickformat": ".0f",
+        "ticksuffix": "%",
+    },
+    "paper_bgcolor": "rgba(0,0,0,0)",
+    "plot_bgcolor": "rgba(15,15,30,0.3)",
+    "font": {"color": "white", "size": 14, "family": styling.FONT_FAMILY},
+    "margin": {"l": 100, "r": 80, "t": 120, "b": 80},
+    "bargap": 0.08,
+    "hoverlabel": {
+        "bgcolor": "rgba(15,15,15,0.98)",
+        "bordercolor": "rgba(255,255,255,0.4)",
+    },
+}
+
 
 def load_walking_routes(csv_path: str) -> Tuple[pd.DataFrame, int]:
     """Load route summary and return walking trips with total trip count.
@@ -34,136 +71,116 @@ def load_walking_routes(csv_path: str) -> Tuple[pd.DataFrame, int]:
     """
     assert os.path.exists(csv_path), f"Missing input file: {csv_path}"
 
-    df = pd.read_csv(csv_path)
-    assert len(df) > 0, "Route summary CSV is empty"
-
-    required_cols = {"transportation_mode", "total_distance_km"}
-    missing = required_cols - set(df.columns)
+    # Check the header first, then load only the two columns used here from
+    # the route summary's Parquet sidecar (written on the first read)
+    header = pd.read_csv(csv_path, nrows=0).columns
+    missing = set(REQUIRED_COLUMNS) - set(header)
     assert not missing, f"Missing required columns: {sorted(missing)}"
 
+    df = data_loader.read_csv_cached(csv_path, columns=list(REQUIRED_COLUMNS))
+    assert len(df) > 0, "Route summary CSV is empty"
+
     total_trips = len(df)
     assert total_trips > 0, "No trips found in the dataset"
 
-    walking_df = df[df["transportation_mode"] == WALKING_HEBREW].copy()
-    # Coerce to numeric and drop invalid
-    walking_df["total_distance_km"] = pd.to_numeric(
-        walking_df["total_distance_km"], errors="coerce"
-    )
-    walking_df = walking_df.dropna(subset=["total_distance_km"])
+    # Filter just the distance column with a plain boolean mask; the mode
+    # column is not needed downstream, so no filtered frame copy is made
+    is_walking = df["transportation_mode"].to_numpy() == WALKING_HEBREW
+    distances = df["total_distance_km"][is_walking]
+    # The parser already types a clean distance column; coerce only if it
+    # came back as text, then drop invalid
+    if not pd.api.types.is_numeric_dtype(distances):
+        distances = pd.to_numeric(distances, errors="coerce")
+    # Pin float64 once so downstream array views need no conversion
+    walking_df = distances.dropna().astype(np.float64, copy=False).to_frame()
 
     assert len(walking_df) > 0, "No valid walking trips found in the dataset"
 
     return walking_df, total_trips
 
 
-def compute_average_distance(walking_df: pd.DataFrame) -> float:
-    """Compute average walking distance in km."""
-    distances = walking_df["total_distance_km"]
-    assert (distances >= 0).all(), "Distances must be non-negative"
+def compute_distance_stats(distances: np.ndarray) -> Tuple[float, float, float]:
+    """Compute average, median and maximum walking distance in km.
+
+    Every statistic is taken from the same float64 array, with basic
+    validation of the results. The median comes from a single O(n)
+    ``np.partition``, whose halves also give the minimum and maximum.
+    """
+    n = distances.size
+    k = n // 2
+    part = np.partition(distances, k)
+    # Everything left of k is <= part[k] and everything right of it is >=
+    assert part[: k + 1].min() >= 0, "Distances must be non-negative"
     avg_km = float(distances.mean())
-    # Guard against nonsensical averages
+    if n % 2:
+        median_km = float(part[k])
+    else:
+        median_km = float(0.5 * (part[k] + part[:k].max()))
+    max_km = float(part[k:].max())
+    # Guard against nonsensical values
     assert 0 <= avg_km < 50, f"Average distance out of expected range: {avg_km:.2f} km"
-    return avg_km
-
-
-def compute_median_and_max_distance(walking_df: pd.DataFrame) -> Tuple[float, float]:
-    """Compute median and maximum walking distance in km with basic validation."""
-    distances = walking_df["total_distance_km"]
-    assert (distances >= 0).all(), "Distances must be non-negative"
-    median_km = float(distances.median())
-    max_km = float(distances.max())
     assert (
         0 <= median_km < 50
     ), f"Median distance out of expected range: {median_km:.2f} km"
     assert 0 <= max_km < 200, f"Max distance out of expected range: {max_km:.2f} km"
-    return median_km, max_km
+    return avg_km, median_km, max_km
 
 
 def create_histogram(
-    walking_df: pd.DataFrame,
+    distances: np.ndarray,
     total_trips: int,
     avg_km: float,
     median_km: float | None = None,
 ) -> go.Figure:
     """Create histogram of walking distances with mean (and optional median) lines."""
-    distances = walking_df["total_distance_km"]
+    # One min/max pass feeds both the bin range and the custom ticks
+    min_km: float = float(distances.min())
+    max_km: float = float(distances.max())
+
+    # Bin in NumPy so the figure carries 20 bars instead of every trip distance;
+    # an explicit range stops np.histogram from scanning for min/max again
+    counts, edges = np.histogram(distances, bins=20, range=(min_km, max_km))
+    percentages = counts * (100.0 / counts.sum())
+    centers = (edges[:-1] + edges[1:]) / 2
 
     fig = go.Figure()
 
     fig.add_trace(
-        go.Histogram(
-            x=distances,
-            nbinsx=20,
+        go.Bar(
+            x=centers,
+            y=percentages,
+            customdata=np.column_stack((edges[:-1], edges[1:])),
             marker=dict(
                 color="rgba(0, 212, 255, 0.7)",
                 line=dict(color="rgba(255,255,255,0.2)", width=1),
             ),
             name="Walking trip distances",
-            hovertemplate="<b>Distance</b>: %{x:.2f} km<br><b>Percentage</b>: %{y:.1f}%<extra></extra>",
-            histfunc="count",
-            histnorm="percent",
+            hovertemplate="<b>Distance</b>: %{customdata[0]:.2f}-%{customdata[1]:.2f} km<br><b>Percentage</b>: %{y:.1f}%<extra></extra>",
         )
     )
 
     # Custom ticks excluding 0
-    min_km: float = float(distances.min())
-    max_km: float = float(distances.max())
     data_range = max(0.01, max_km - min_km)
     if data_range <= 2:
         step = 0.1
-        fmt = "{:.1f}"
+        fmt = "%.1f"
     elif data_range <= 5:
         step = 0.25
-        fmt = "{:.2f}"
+        fmt = "%.2f"
     else:
         step = 0.5
-        fmt = "{:.1f}"
+        fmt = "%.1f"
     start = math.floor(min_km / step) * step
     end = math.ceil(max_km / step) * step
-    tickvals = []
-    v = start
-    # Guard against infinite loops
-    max_iters = 1000
-    iters = 0
-    while v <= end + 1e-9 and iters < max_iters:
-        if abs(v) > 1e-9:
-            tickvals.append(round(v, 2))
-        v += step
-        iters += 1
-    ticktext = [fmt.format(tv) for tv in tickvals]
+    # Ticks are start + i * step, so rounding error does not accumulate
+    n_ticks = int(round((end - start) / step)) + 1
+    tickvals = (start + step * np.arange(n_ticks)).round(2)
+    tickvals = tickvals[np.abs(tickvals) > 1e-9]
+    ticktext = np.char.mod(fmt, tickvals).tolist()
 
     fig.update_layout(
-        title=dict(
-            text="Walking Distance to Campus",
-            x=0.5,
-            xanchor="center",
-            font=dict(size=32, color="white", family=styling.FONT_FAMILY),
-        ),
-        xaxis=dict(
-            title="Distance (km)",
-            titlefont=dict(size=18, color="white"),
-            tickfont=dict(size=14, color="rgba(255,255,255,0.95)"),
-            gridcolor="rgba(255,255,255,0.12)",
-            tickmode="array",
-            tickvals=tickvals,
-            ticktext=ticktext,
-        ),
-        yaxis=dict(
-            title="% of all trips",
-            titlefont=dict(size=18, color="white"),
-            tickfont=dict(size=14, color="rgba(255,255,255,0.95)"),
-            gridcolor="rgba(255,255,255,0.12)",
-            tickformat=".0f",
-            ticksuffix="%",
-        ),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(15,15,30,0.3)",
-        font=dict(color="white", size=14, family=styling.FONT_FAMILY),
-        margin=dict(l=100, r=80, t=120, b=80),
-        bargap=0.08,
-        hoverlabel=dict(
-            bgcolor="rgba(15,15,15,0.98)", bordercolor="rgba(255,255,255,0.4)"
-        ),
+        HISTOGRAM_LAYOUT,
+        xaxis={**HISTOGRAM_XAXIS, "tickvals": tickvals, "ticktext": ticktext},
     )
 
     return fig
@@ -181,10 +198,11 @@ def save_stats(avg_km: float, median_km: float, max_km: float) -> None:
 
 def main() -> Tuple[pd.DataFrame, float]:
     walking_df, total_trips = load_walking_routes(ROUTE_SUMMARY_PATH)
-    avg_km = compute_average_distance(walking_df)
-    median_km, max_km = compute_median_and_max_distance(walking_df)
+    # One float64 view of the distances feeds both the stats and the chart
+    distances = walking_df["total_distance_km"].to_numpy(dtype=np.float64, copy=False)
+    avg_km, median_km, max_km = compute_distance_stats(distances)
 
-    fig = create_histogram(walking_df, total_trips, avg_km, median_km)
+    fig = create_histogram(distances, total_trips, avg_km, median_km)
     exporter.export_figure(
         fig,
         "walking_distance",
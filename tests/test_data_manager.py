@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+
+from data_manager import DataManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return DataManager()
+
+
+def test_route_choice_data_without_factor_columns(manager, monkeypatch):
+    df = pd.DataFrame({"Submission ID": [1, 2], "Transportation-Mode": ["רכב", ""]})
+    monkeypatch.setattr(manager, "load_processed_data", lambda: df)
+
+    assert manager.get_route_choice_data() == {}
+
+
+def test_read_csv_cached_recovers_from_truncated_sidecar(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "routes.csv"
+    csv_path.write_text("mode,km\nברגל,1.5\nרכב,7.0\n", encoding="utf-8")
+    parquet_path = tmp_path / "routes.parquet"
+
+    expected = DataManager.read_csv_cached(str(csv_path))
+    # Simulate an interrupted write that still looks fresher than the CSV
+    parquet_path.write_bytes(parquet_path.read_bytes()[:10])
+
+    df = DataManager.read_csv_cached(str(csv_path))
+
+    pd.testing.assert_frame_equal(df, expected)
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), expected)
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
@@ -0,0 +1,44 @@
+import json
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("plotly")
+
+from viz_utils import VizDataLoader, VizExporter
+
+
+def test_load_processed_data_recovers_from_truncated_sidecar(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    (tmp_path / VizDataLoader.PROCESSED_DATA_PATH).write_text(
+        "Submission ID,Transportation-Mode\n1,ברגל\n2,רכב\n", encoding="utf-8"
+    )
+    parquet_path = tmp_path / VizDataLoader.PROCESSED_PARQUET_PATH
+
+    expected = VizDataLoader().load_processed_data(columns=["Transportation-Mode"])
+    # Simulate an interrupted write that still looks fresher than the CSV
+    parquet_path.write_bytes(parquet_path.read_bytes()[:10])
+
+    df = VizDataLoader().load_processed_data(columns=["Transportation-Mode"])
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert pd.read_parquet(parquet_path).shape == (2, 2)
+
+
+def test_figure_json_escapes_script_breakouts(tmp_path):
+    hover = "Gate </script><script>alert(1)</script> \u2028\u2029"
+    fig = {"data": [{"type": "bar", "x": ["a"], "y": [1], "hovertext": hover}]}
+
+    payload = VizExporter.figure_to_json_bytes(fig)
+
+    for raw in (b"<", b">", b"/", "\u2028".encode(), "\u2029".encode()):
+        assert raw not in payload
+    assert json.loads(payload)["data"][0]["hovertext"] == hover
+
+    html_path = tmp_path / "chart.html"
+    VizExporter.create_iframe_optimized_html(fig, str(html_path), "Chart")
+    html = html_path.read_text(encoding="utf-8")
+    # Only the template's own script blocks are closed
+    assert html.count("</script>") == 2